@@ -0,0 +1,31 @@
+import argparse
+import dataclasses
+import timeit
+
+from pydataconfig.cli_loader.cli_loader import CliLoader, argument_parsers
+
+FIELDS_COUNT = 500
+NUMBER = 200
+
+Config = dataclasses.make_dataclass('Config', [(f'field_{i}', int, 0) for i in range(FIELDS_COUNT)])
+ARGV = ['--field-1', '1', '--field-250', '250']
+
+
+def measure(label: str, statement, number: int = NUMBER) -> None:
+    seconds = timeit.timeit(statement, number=number) / number
+    print(f'{label:45} {seconds * 1e3:8.3f} ms')
+
+
+def main():
+    print(f'{FIELDS_COUNT} fields, argv: {" ".join(ARGV)}')
+    measure('construction, new parser every time',
+            lambda: CliLoader(Config(), argument_parser=argparse.ArgumentParser(), argv=ARGV))
+    argument_parsers.clear()
+    measure('construction, first (uncached)', lambda: CliLoader(Config(), argv=ARGV), number=1)
+    measure('construction, cached', lambda: CliLoader(Config(), argv=ARGV))
+    config_loader = CliLoader(Config(), argv=ARGV)
+    measure('load', config_loader.load)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+import dataclasses
+import tracemalloc
+from pathlib import Path
+
+from pydataconfig.observable_config import ObservableConfig
+from pydataconfig.slotted_config import slotted_config
+
+INSTANCES_COUNT = 10_000
+
+
+def create_config_class(decorator, bases: tuple[type, ...] = ()):
+    namespace = {
+        '__annotations__': {'name': str, 'region': str, 'port': int, 'path': Path, 'tags': list[str]},
+        'name': 'tenant',
+        'region': 'eu-west-1',
+        'port': 8080,
+        'path': Path('/srv'),
+        'tags': dataclasses.field(default_factory=lambda: ['tag1', 'tag2']),
+    }
+    return decorator(type('Config', bases, namespace))
+
+
+def on_region_changed(old_value, new_value):
+    pass
+
+
+def measure(config_class, subscribe: bool = False) -> int:
+    tracemalloc.start()
+    configs = [config_class() for _ in range(INSTANCES_COUNT)]
+    if subscribe:
+        # Allocates the per-instance Event (and for slotted configs, its side table entry and finalizer)
+        for config in configs:
+            config.on_region_changed += on_region_changed
+    for i, config in enumerate(configs):
+        # Built at runtime, like values read by loaders, so equal strings are distinct objects
+        config.region = ''.join(['us-east-', str(i % 3)])
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def main():
+    compact = slotted_config(shared_defaults=True, intern_strings=True)
+    observable_config_class = create_config_class(dataclasses.dataclass, (ObservableConfig,))
+    slotted_observable_config_class = create_config_class(compact, (ObservableConfig,))
+    measurements = {
+        'dataclass': (create_config_class(dataclasses.dataclass), False),
+        'slotted_config': (create_config_class(slotted_config), False),
+        'slotted_config(shared_defaults, intern_strings)': (create_config_class(compact), False),
+        'dataclass(ObservableConfig)': (observable_config_class, False),
+        'slotted_config(ObservableConfig, shared, intern)': (slotted_observable_config_class, False),
+        'dataclass(ObservableConfig), subscribed': (observable_config_class, True),
+        'slotted_config(ObservableConfig, shared, intern), subscribed': (slotted_observable_config_class, True),
+    }
+    print(f'{INSTANCES_COUNT} instances')
+    for label, (config_class, subscribe) in measurements.items():
+        print(f'{label:62} {measure(config_class, subscribe) / 1024:8.0f} KiB')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,9 @@
 import platform
+import typing
 from pathlib import Path
 
 from pydataconfig.base_loader import ConfigLoader
-from pydataconfig.cli_loader.cli_loader import CliLoader
+from pydataconfig.cli_loader.cli_loader import CliLoader, SubcommandCliLoader
 from pydataconfig.composite_loader import CompositeLoader
 from pydataconfig.config_file_loader.config_file_loader import ConfigFileLoader, ConfigType
 from pydataconfig.env_loader.env_loader import EnvLoader
@@ -13,7 +14,7 @@ from pydataconfig.system_loader import SystemConfigType
 def create_config_loader(
         config,
         field_converter: FieldConverter = FieldConverter(),
-        cli: bool = False,
+        cli: bool = False, argv: typing.Sequence[str] = None,
         dot_env: bool = False, env: bool = False,
         config_path: Path = None,
         system_global: bool = False, system_user: bool = False,
@@ -55,7 +56,7 @@ def create_config_loader(
     if env:
         config_loaders.append(EnvLoader(config, field_converter=field_converter))
     if cli:
-        config_loaders.append(CliLoader(config, field_converter=field_converter))
+        config_loaders.append(CliLoader(config, field_converter=field_converter, argv=argv))
     if len(config_loaders) == 1:
         return config_loaders[0]
     return CompositeLoader(config_loaders)
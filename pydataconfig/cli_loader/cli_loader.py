@@ -1,40 +1,170 @@
 import argparse
+import collections
 import dataclasses
+import functools
+import threading
 import typing
 
 from pydataconfig.base_loader import ConfigLoader
 from pydataconfig.field_converter import FieldConverter
 
 
+SUBCOMMAND_DEST = '_pydataconfig_subcommand'
+ARGUMENT_PARSERS_CACHE_SIZE = 128
+
+
+@functools.lru_cache(maxsize=ARGUMENT_PARSERS_CACHE_SIZE)
+def get_config_fields(config_type: type) -> dict[str, dataclasses.Field]:
+    return {field.name: field for field in dataclasses.fields(config_type)}
+
+
+def add_config_arguments(argument_parser: argparse.ArgumentParser,
+                         config_type: type,
+                         field_converter: FieldConverter) -> None:
+    for field_name, field in get_config_fields(config_type).items():
+        cli_arg_name = field_name.replace('_', '-')
+        # Arguments missing from the command line are left out of the namespace, so they are neither converted
+        # nor override values set by previous loaders
+        kwargs = {'default': argparse.SUPPRESS}
+        if field.type is bool:
+            kwargs['action'] = argparse.BooleanOptionalAction
+        else:
+            if typing.get_origin(field.type) is list:
+                kwargs['nargs'] = '*'
+                kwargs['type'] = field_converter.get_type_converter(typing.get_args(field.type)[0])
+            else:
+                kwargs['type'] = field_converter.get_field_converter(field)
+        argument_parser.add_argument(f'--{cli_arg_name}', **kwargs)
+
+
+argument_parsers: collections.OrderedDict[typing.Hashable, argparse.ArgumentParser] = collections.OrderedDict()
+argument_parsers_lock = threading.Lock()
+
+
+def get_field_converter_key(field_converter: FieldConverter) -> typing.Hashable | None:
+    # Subclasses may override how fields are converted, which their settings don't reflect, so they aren't cached
+    if type(field_converter) is not FieldConverter:
+        return None
+    return field_converter.get_key()
+
+
+def get_cached_argument_parser(key: typing.Hashable,
+                               create_argument_parser: typing.Callable[[], argparse.ArgumentParser]
+                               ) -> argparse.ArgumentParser:
+    try:
+        hash(key)
+    except TypeError:
+        # e.g. unhashable csv reader kwargs
+        return create_argument_parser()
+    with argument_parsers_lock:
+        argument_parser = argument_parsers.get(key)
+        if argument_parser is not None:
+            argument_parsers.move_to_end(key)
+            return argument_parser
+    argument_parser = create_argument_parser()
+    with argument_parsers_lock:
+        argument_parsers[key] = argument_parser
+        if len(argument_parsers) > ARGUMENT_PARSERS_CACHE_SIZE:
+            argument_parsers.popitem(last=False)
+    return argument_parser
+
+
+def get_argument_parser(config_type: type,
+                        field_converter: FieldConverter,
+                        add_help: bool = True) -> argparse.ArgumentParser:
+    def create_argument_parser():
+        argument_parser = argparse.ArgumentParser(add_help=add_help)
+        add_config_arguments(argument_parser, config_type, field_converter)
+        return argument_parser
+    field_converter_key = get_field_converter_key(field_converter)
+    if field_converter_key is None:
+        return create_argument_parser()
+    return get_cached_argument_parser((config_type, field_converter_key, add_help), create_argument_parser)
+
+
+def get_subcommand_argument_parser(subcommand_to_config_type: tuple[tuple[str, type], ...],
+                                   field_converter: FieldConverter,
+                                   dest: str) -> argparse.ArgumentParser:
+    def create_argument_parser():
+        argument_parser = argparse.ArgumentParser()
+        subparsers = argument_parser.add_subparsers(dest=dest, required=True)
+        for subcommand, config_type in subcommand_to_config_type:
+            subparsers.add_parser(subcommand,
+                                  parents=[get_argument_parser(config_type, field_converter, add_help=False)])
+        return argument_parser
+    field_converter_key = get_field_converter_key(field_converter)
+    if field_converter_key is None:
+        return create_argument_parser()
+    return get_cached_argument_parser((subcommand_to_config_type, field_converter_key, dest),
+                                      create_argument_parser)
+
+
 class CliLoader(ConfigLoader):
 
     def __init__(self,
                  config,
                  field_converter: FieldConverter = FieldConverter(),
-                 argument_parser: argparse.ArgumentParser = None):
+                 argument_parser: argparse.ArgumentParser = None,
+                 argv: typing.Sequence[str] = None):
         self.config = config
         self.field_converter = field_converter
-        self.argument_parser = argument_parser or argparse.ArgumentParser()
-        self.config_fields = {field.name: field for field in dataclasses.fields(self.config)}
-
-        for field_name, field in self.config_fields.items():
-            cli_arg_name = field_name.replace('_', '-')
-            kwargs = {}
-            if field.type is bool:
-                kwargs['action'] = argparse.BooleanOptionalAction
-            else:
-                if typing.get_origin(field.type) is list:
-                    kwargs['nargs'] = '*'
-                    kwargs['type'] = self.field_converter.get_type_converter(typing.get_args(field.type)[0])
-                else:
-                    kwargs['type'] = self.field_converter.get_field_converter(field)
-            self.argument_parser.add_argument(f'--{cli_arg_name}', **kwargs)
+        self.argv = argv
+        self.config_fields = get_config_fields(type(self.config))
+        if argument_parser is None:
+            self._argument_parser = get_argument_parser(type(self.config), self.field_converter)
+            self._is_argument_parser_shared = True
+        else:
+            self._argument_parser = argument_parser
+            self._is_argument_parser_shared = False
+            add_config_arguments(self._argument_parser, type(self.config), self.field_converter)
+
+    @property
+    def argument_parser(self) -> argparse.ArgumentParser:
+        if self._is_argument_parser_shared:
+            # The cached parser is shared between loaders, so copy it before it can be customized
+            self._argument_parser = argparse.ArgumentParser(add_help=False, parents=[self._argument_parser])
+            self._is_argument_parser_shared = False
+        return self._argument_parser
 
     def load(self):
-        namespace, args = self.argument_parser.parse_known_args()
+        namespace, args = self._argument_parser.parse_known_args(self.argv)
         for arg_name, arg_value in vars(namespace).items():
             if arg_name in self.config_fields:
                 setattr(self.config, arg_name, arg_value)
 
     def print_help(self, *args, **kwargs):
-        self.argument_parser.print_help(*args, **kwargs)
+        self._argument_parser.print_help(*args, **kwargs)
+
+
+class SubcommandCliLoader(ConfigLoader):
+
+    def __init__(self,
+                 subcommand_to_config: dict[str, typing.Any],
+                 field_converter: FieldConverter = FieldConverter(),
+                 argv: typing.Sequence[str] = None,
+                 dest: str = SUBCOMMAND_DEST):
+        self.subcommand_to_config = subcommand_to_config
+        self.field_converter = field_converter
+        self.argv = argv
+        self.dest = dest
+        self.subcommand: str | None = None
+        for subcommand, config in self.subcommand_to_config.items():
+            if self.dest in get_config_fields(type(config)):
+                raise ValueError(f'Subcommand dest: {self.dest} collides with a field of subcommand: {subcommand}')
+        subcommand_to_config_type = tuple((subcommand, type(config))
+                                          for subcommand, config in self.subcommand_to_config.items())
+        self._argument_parser = get_subcommand_argument_parser(subcommand_to_config_type, self.field_converter,
+                                                               self.dest)
+
+    def load(self):
+        namespace, args = self._argument_parser.parse_known_args(self.argv)
+        arg_name_to_value = vars(namespace)
+        self.subcommand = arg_name_to_value.pop(self.dest)
+        config = self.subcommand_to_config[self.subcommand]
+        config_fields = get_config_fields(type(config))
+        for arg_name, arg_value in arg_name_to_value.items():
+            if arg_name in config_fields:
+                setattr(config, arg_name, arg_value)
+
+    def print_help(self, *args, **kwargs):
+        self._argument_parser.print_help(*args, **kwargs)
@@ -4,14 +4,26 @@ import re
 import typing
 
 
+def convert_pattern(value):
+    return re.compile(value)
+
+
+def convert_bool(value):
+    return value if isinstance(value, bool) else value.lower() == 'true'
+
+
 class FieldConverter:
     def __init__(self, **csv_reader_kwargs):
         self.csv_reader_kwargs = csv_reader_kwargs
         self.field_type_to_conversion = {
-            re.Pattern: lambda value: re.compile(value),
-            bool: lambda value: value if isinstance(value, bool) else value.lower() == 'true'
+            re.Pattern: convert_pattern,
+            bool: convert_bool
         }
 
+    def get_key(self) -> typing.Hashable:
+        # Equal for converters with the same settings, so their products (e.g. CLI parsers) can be shared
+        return tuple(self.csv_reader_kwargs.items()), tuple(self.field_type_to_conversion.items())
+
     def get_type_converter(self, type_):
         return self.field_type_to_conversion.get(type_, type_)
 
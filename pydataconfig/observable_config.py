@@ -6,6 +6,7 @@ import inspect
 
 import threading
 import asyncio
+import weakref
 
 
 type CallbackType[**P] = Callable[P, Any] | Callable[P, Awaitable[Any]]
@@ -106,7 +107,22 @@ ON_CHANGED_PATTERN = re.compile(r'on_(.+)_changed')
 ON_CHANGED_FORMAT = 'on_{name}_changed'
 
 
+# Events of configs without a `__dict__` (e.g. `slotted_config` classes), by config id
+CONFIG_ID_TO_EVENTS: dict[int, dict[str, Event]] = {}
+
+
 class ObservableConfig:
+    __slots__ = ()
+
+    def _get_events(self, create: bool = False) -> dict[str, Event] | None:
+        if type(self).__dictoffset__:
+            return self.__dict__
+        events = CONFIG_ID_TO_EVENTS.get(id(self))
+        if events is None and create:
+            events = CONFIG_ID_TO_EVENTS[id(self)] = {}
+            weakref.finalize(self, CONFIG_ID_TO_EVENTS.pop, id(self), None)
+        return events
+
     def __getattr__(self, name: str) -> Any:
         match = re.match(ON_CHANGED_PATTERN, name)
         if not match:
@@ -114,15 +130,23 @@ class ObservableConfig:
         key = match.group(1)
         if not hasattr(self, key):
             raise AttributeError(f'No field called: {key} found for: {name}')
-        event = Event()
-        super().__setattr__(name, event)
+        events = self._get_events(create=True)
+        event = events.get(name)
+        if event is None:
+            event = events[name] = Event()
         return event
 
     def __setattr__(self, name: str, value: Any):
-        previous_value = getattr(self, name)
+        if isinstance(value, Event) and re.match(ON_CHANGED_PATTERN, name):
+            # e.g. `config.on_field_changed += callback`
+            self._get_events(create=True)[name] = value
+            return
+        previous_value = getattr(self, name, None)
         super().__setattr__(name, value)
         if value == previous_value:
             return
-        event = getattr(self, ON_CHANGED_FORMAT.format(name=name), None)
+        # Look the event up without creating it, so fields nobody listens to don't allocate events
+        events = self._get_events()
+        event = events.get(ON_CHANGED_FORMAT.format(name=name)) if events else None
         if isinstance(event, Event):
             event(previous_value, value)
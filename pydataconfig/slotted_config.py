@@ -0,0 +1,75 @@
+import dataclasses
+import enum
+import re
+import sys
+from pathlib import PurePath
+from typing import Any
+
+
+IMMUTABLE_TYPES = (str, bytes, int, float, complex, bool, type(None))
+IMMUTABLE_BASE_TYPES = (PurePath, re.Pattern, enum.Enum)
+
+
+def freeze_value(value: Any) -> Any:
+    if type(value) in IMMUTABLE_TYPES or isinstance(value, IMMUTABLE_BASE_TYPES):
+        return value
+    if type(value) in (list, tuple):
+        return tuple(freeze_value(item) for item in value)
+    if type(value) in (set, frozenset):
+        return frozenset(freeze_value(item) for item in value)
+    raise TypeError(f'Value of type: {type(value).__name__} is not known to be immutable')
+
+
+def intern_value(value: Any) -> Any:
+    # `sys.intern` rejects str subclasses (e.g. `enum.StrEnum` members)
+    if type(value) is str:
+        return sys.intern(value)
+    if type(value) is list:
+        # In place, so the config keeps the assigned list itself
+        for i, item in enumerate(value):
+            if type(item) is str:
+                value[i] = sys.intern(item)
+    # Keep already interned tuples (e.g. shared defaults) as is
+    elif type(value) is tuple and any(type(item) is str and sys.intern(item) is not item for item in value):
+        return tuple(sys.intern(item) if type(item) is str else item for item in value)
+    return value
+
+
+def share_defaults(cls) -> None:
+    for name, value in vars(cls).items():
+        if not isinstance(value, dataclasses.Field) or value.default_factory is dataclasses.MISSING:
+            continue
+        try:
+            default = freeze_value(value.default_factory())
+        except TypeError:
+            # Values that may be mutable (e.g. dicts or class instances) can't be shared safely,
+            # so they keep their factory
+            continue
+        value.default = default
+        value.default_factory = dataclasses.MISSING
+
+
+def add_interning(cls) -> None:
+    def __setattr__(self, name: str, value: Any):
+        super(cls, self).__setattr__(name, intern_value(value))
+    __setattr__.__qualname__ = f'{cls.__qualname__}.__setattr__'
+    cls.__setattr__ = __setattr__
+
+
+def slotted_config(cls=None, /, *, shared_defaults: bool = False, intern_strings: bool = False):
+    def wrap(cls):
+        # Subclasses of dataclasses inherit `__dataclass_fields__`, so only look at the class itself
+        if '__dataclass_fields__' in cls.__dict__:
+            raise TypeError(f'{cls.__name__} is already a dataclass, use @slotted_config instead of @dataclass')
+        if shared_defaults:
+            share_defaults(cls)
+        # Bases that support weak references (e.g. other slotted configs) already provide `__weakref__`
+        weakref_slot = not any(base.__weakrefoffset__ for base in cls.__bases__)
+        slotted_cls = dataclasses.dataclass(cls, slots=True, weakref_slot=weakref_slot)
+        if intern_strings:
+            add_interning(slotted_cls)
+        return slotted_cls
+
+    if cls is None:
+        return wrap
+    return wrap(cls)
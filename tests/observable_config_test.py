@@ -6,7 +6,8 @@ import dataclasses
 
 import unittest
 
-from pydataconfig.observable_config import ObservableConfig
+from pydataconfig.observable_config import ObservableConfig, CONFIG_ID_TO_EVENTS, Event
+from pydataconfig.slotted_config import slotted_config
 
 
 @dataclasses.dataclass
@@ -14,6 +15,12 @@ class Config(ObservableConfig):
     str_field: str = 'default_str_value'
 
 
+@slotted_config
+class SlottedConfig(ObservableConfig):
+    str_field: str = 'default_str_value'
+    event_field: Event = dataclasses.field(default_factory=Event)
+
+
 class PyDataConfigTest(unittest.IsolatedAsyncioTestCase):
 
     def setUp(self):
@@ -111,3 +118,35 @@ class PyDataConfigTest(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(expected_old_value, actual_old_value)
         self.assertEqual(expected_new_value, actual_new_value)
+
+    def test_callback_slotted(self):
+        config = SlottedConfig()
+        actual_old_value = None
+        actual_new_value = None
+        expected_old_value = config.str_field
+        expected_new_value = 'new_value'
+
+        def on_str_field_changed(old_value, new_value):
+            nonlocal actual_old_value
+            nonlocal actual_new_value
+            actual_old_value = old_value
+            actual_new_value = new_value
+
+        self.assertNotIn(id(config), CONFIG_ID_TO_EVENTS)
+        config.on_str_field_changed += on_str_field_changed
+        config.str_field = expected_new_value
+
+        self.assertFalse(hasattr(config, '__dict__'))
+        self.assertEqual(expected_old_value, actual_old_value)
+        self.assertEqual(expected_new_value, actual_new_value)
+
+        config_id = id(config)
+        del config
+        self.assertNotIn(config_id, CONFIG_ID_TO_EVENTS)
+
+    def test_event_field_slotted(self):
+        config = SlottedConfig()
+        event = Event()
+        config.event_field = event
+        self.assertIs(event, config.event_field)
+        self.assertNotIn(id(config), CONFIG_ID_TO_EVENTS)
@@ -9,7 +9,8 @@ import sys
 import unittest
 from pathlib import Path
 
-from pydataconfig import create_config_loader, CliLoader
+from pydataconfig import create_config_loader, CliLoader, SubcommandCliLoader, FieldConverter
+from pydataconfig.cli_loader.cli_loader import ARGUMENT_PARSERS_CACHE_SIZE, argument_parsers
 
 
 @dataclasses.dataclass
@@ -30,6 +31,17 @@ class Config:
                                                                               re.compile(r'default_pattern_value2')])
 
 
+@dataclasses.dataclass
+class OtherConfig:
+    str_field: str = 'other_default_str_value'
+    float_field: float = 1.5
+
+
+@dataclasses.dataclass
+class SubcommandConfig:
+    subcommand: str = 'default_subcommand_value'
+
+
 CLI_HELP_OUTPUT = '''
 usage: _jb_unittest_runner.py [-h] [--str-field STR_FIELD]
                               [--int-field INT_FIELD]
@@ -114,6 +126,82 @@ class PyDataConfigTest(unittest.TestCase):
         self.assertEqual([re.compile('cli_pattern_value1'), re.compile('cli_pattern_value2')],
                          self.config.list_pattern_field)
 
+    def test_cli_argv(self):
+        config_loader = CliLoader(self.config, argv=shlex.split('--str-field cli_str_value --int-field 43'))
+        config_loader.load()
+        self.assertEqual('cli_str_value', self.config.str_field)
+        self.assertEqual(43, self.config.int_field)
+
+    def test_cli_missing_args_keep_value(self):
+        self.config.str_field = 'previous_str_value'
+        config_loader = CliLoader(self.config, argv=shlex.split('--int-field 43'))
+        config_loader.load()
+        self.assertEqual('previous_str_value', self.config.str_field)
+        self.assertEqual(43, self.config.int_field)
+        self.assertEqual(Config.bool_field_true, self.config.bool_field_true)
+        self.assertEqual(Config.list_int_field, self.config.list_int_field)
+
+    def test_cli_argument_parser_cached(self):
+        config_loader = CliLoader(self.config, argv=[])
+        other_config_loader = CliLoader(Config(), argv=[])
+        self.assertIs(config_loader._argument_parser, other_config_loader._argument_parser)
+
+    def test_cli_argument_parser_cached_by_field_converter_settings(self):
+        config_loader = CliLoader(self.config, field_converter=FieldConverter(delimiter=';'), argv=[])
+        other_config_loader = CliLoader(Config(), field_converter=FieldConverter(delimiter=';'), argv=[])
+        self.assertIs(config_loader._argument_parser, other_config_loader._argument_parser)
+        self.assertIsNot(config_loader._argument_parser, CliLoader(Config(), argv=[])._argument_parser)
+
+    def test_cli_argument_parser_field_converter_subclass(self):
+        class UpperFieldConverter(FieldConverter):
+            def get_field_converter(self, field):
+                if field.type is str:
+                    return str.upper
+                return super().get_field_converter(field)
+
+        CliLoader(Config(), argv=[]).load()
+        config_loader = CliLoader(self.config, field_converter=UpperFieldConverter(),
+                                  argv=shlex.split('--str-field cli_str_value'))
+        config_loader.load()
+        self.assertEqual('CLI_STR_VALUE', self.config.str_field)
+
+    def test_cli_argument_parser_cache_size(self):
+        for i in range(ARGUMENT_PARSERS_CACHE_SIZE + 1):
+            CliLoader(self.config, field_converter=FieldConverter(delimiter=str(i)), argv=[])
+        self.assertEqual(ARGUMENT_PARSERS_CACHE_SIZE, len(argument_parsers))
+
+    def test_cli_argument_parser_customized(self):
+        config_loader = CliLoader(self.config, argv=shlex.split('--extra extra_value --int-field 43'))
+        config_loader.argument_parser.add_argument('--extra')
+        other_config = Config()
+        other_config_loader = CliLoader(other_config, argv=shlex.split('--int-field 44'))
+        config_loader.load()
+        other_config_loader.load()
+        self.assertEqual(43, self.config.int_field)
+        self.assertEqual(44, other_config.int_field)
+        self.assertNotIn('--extra', other_config_loader.argument_parser._option_string_actions)
+
+    def test_cli_subcommand(self):
+        other_config = OtherConfig()
+        config_loader = SubcommandCliLoader({'main': self.config, 'other': other_config},
+                                            argv=shlex.split('other --str-field cli_str_value --float-field 2.5'))
+        config_loader.load()
+        self.assertEqual('other', config_loader.subcommand)
+        self.assertEqual('cli_str_value', other_config.str_field)
+        self.assertEqual(2.5, other_config.float_field)
+        self.assertEqual(Config.str_field, self.config.str_field)
+
+    def test_cli_subcommand_field(self):
+        subcommand_config = SubcommandConfig()
+        config_loader = SubcommandCliLoader({'run': subcommand_config}, argv=shlex.split('run --subcommand value'))
+        config_loader.load()
+        self.assertEqual('run', config_loader.subcommand)
+        self.assertEqual('value', subcommand_config.subcommand)
+
+    def test_cli_subcommand_dest_collision(self):
+        with self.assertRaises(ValueError):
+            SubcommandCliLoader({'run': SubcommandConfig()}, dest='subcommand')
+
     def test_env_str(self):
         os.environ['str_field'] = 'env_str_value'
         os.environ['int_field'] = str(44)
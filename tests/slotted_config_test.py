@@ -0,0 +1,158 @@
+import dataclasses
+import enum
+import os
+import shlex
+import typing
+import unittest
+from pathlib import Path
+
+from pydataconfig import create_config_loader
+from pydataconfig.slotted_config import slotted_config
+
+
+@slotted_config
+class Config:
+    str_field: str = 'default_str_value'
+    int_field: int = 42
+    path_field: Path = Path('default_path_value')
+    list_str_field: list[str] = dataclasses.field(default_factory=lambda: ['default_str_value1',
+                                                                           'default_str_value2'])
+
+
+class Color(enum.StrEnum):
+    RED = 'red'
+    BLUE = 'blue'
+
+
+class Point(typing.NamedTuple):
+    x: str
+    y: str
+
+
+class Holder:
+    def __init__(self):
+        self.items = []
+
+
+@slotted_config(shared_defaults=True, intern_strings=True)
+class CompactConfig:
+    color_field: Color = Color.RED
+    str_field: str = 'default_str_value'
+    list_str_field: list[str] = dataclasses.field(default_factory=lambda: ['default_str_value1',
+                                                                           'default_str_value2'])
+    dict_field: dict[str, str] = dataclasses.field(default_factory=dict)
+    holder_field: Holder = dataclasses.field(default_factory=Holder)
+    list_list_int_field: list[list[int]] = dataclasses.field(default_factory=lambda: [[1]])
+    list_path_field: list[Path] = dataclasses.field(default_factory=lambda: [Path('default_path_value')])
+    point_field: Point = Point('0', '0')
+
+
+@slotted_config
+class SubConfig(Config):
+    float_field: float = 1.5
+
+
+@dataclasses.dataclass
+class DataclassConfig:
+    str_field: str = 'default_str_value'
+
+
+@slotted_config
+class DataclassSubConfig(DataclassConfig):
+    float_field: float = 1.5
+
+
+class SlottedConfigTest(unittest.TestCase):
+
+    def test_no_dict(self):
+        config = Config()
+        self.assertFalse(hasattr(config, '__dict__'))
+        with self.assertRaises(AttributeError):
+            config.unknown_field = 'value'
+
+    def test_already_dataclass(self):
+        with self.assertRaises(TypeError):
+            slotted_config(dataclasses.dataclass(type('Config', (), {})))
+
+    def test_slotted_base(self):
+        config = SubConfig()
+        self.assertFalse(hasattr(config, '__dict__'))
+        create_config_loader(config, cli=True, argv=shlex.split('--str-field cli_str_value --float-field 2.5')).load()
+        self.assertEqual('cli_str_value', config.str_field)
+        self.assertEqual(2.5, config.float_field)
+
+    def test_dataclass_base(self):
+        config = DataclassSubConfig()
+        create_config_loader(config, cli=True, argv=shlex.split('--str-field cli_str_value --float-field 2.5')).load()
+        self.assertEqual('cli_str_value', config.str_field)
+        self.assertEqual(2.5, config.float_field)
+
+    def test_cli(self):
+        config = Config()
+        config_loader = create_config_loader(config, cli=True, argv=shlex.split(
+            '--str-field cli_str_value --int-field 43 --list-str-field cli_str_value1 cli_str_value2'))
+        config_loader.load()
+        self.assertEqual('cli_str_value', config.str_field)
+        self.assertEqual(43, config.int_field)
+        self.assertEqual(Path('default_path_value'), config.path_field)
+        self.assertEqual(['cli_str_value1', 'cli_str_value2'], config.list_str_field)
+
+    def test_env(self):
+        config = Config()
+        os.environ['path_field'] = str(Path('env_path_value'))
+        try:
+            create_config_loader(config, env=True).load()
+        finally:
+            del os.environ['path_field']
+        self.assertEqual(Path('env_path_value'), config.path_field)
+
+    def test_shared_defaults(self):
+        config, other_config = CompactConfig(), CompactConfig()
+        self.assertEqual(('default_str_value1', 'default_str_value2'), config.list_str_field)
+        self.assertIs(config.list_str_field, other_config.list_str_field)
+        self.assertIs(config.list_path_field, other_config.list_path_field)
+        self.assertEqual(((1,),), config.list_list_int_field)
+        self.assertIs(config.list_list_int_field, other_config.list_list_int_field)
+
+    def test_shared_defaults_mutable(self):
+        config, other_config = CompactConfig(), CompactConfig()
+        config.dict_field['key'] = 'value'
+        config.holder_field.items.append('value')
+        self.assertEqual({}, other_config.dict_field)
+        self.assertEqual([], other_config.holder_field.items)
+
+    def test_intern_strings(self):
+        config, other_config = CompactConfig(), CompactConfig()
+        config.str_field = ''.join(['tenant', '_value'])
+        other_config.str_field = ''.join(['tenant', '_value'])
+        self.assertIs(config.str_field, other_config.str_field)
+        config.list_str_field = [''.join(['tenant', '_value'])]
+        self.assertIs(config.str_field, config.list_str_field[0])
+
+    def test_intern_str_subclass(self):
+        config = CompactConfig()
+        config.color_field = Color.BLUE
+        config.list_str_field = [Color.RED, ''.join(['tenant', '_value'])]
+        self.assertIs(Color.BLUE, config.color_field)
+        self.assertIs(Color.RED, config.list_str_field[0])
+
+
+    def test_intern_tuple_subclass(self):
+        config = CompactConfig()
+        point = Point(''.join(['default', '_str_value']), 'y')
+        config.point_field = point
+        self.assertIs(point, config.point_field)
+
+
+    def test_intern_list_in_place(self):
+        config = CompactConfig()
+        list_str = [''.join(['default', '_str_value'])]
+        config.list_str_field = list_str
+        self.assertIs(list_str, config.list_str_field)
+        self.assertIs(config.str_field, list_str[0])
+        list_str.append('value')
+        self.assertEqual(['default_str_value', 'value'], config.list_str_field)
+
+
+if __name__ == '__main__':
+    unittest.main()